@@ -0,0 +1,30 @@
+# Generated by Django 4.2.2 on 2026-08-28 06:51
+
+from django.db import migrations, models
+
+
+def backfill_product_name(apps, schema_editor):
+    Task = apps.get_model('api', 'Task')
+    Product = apps.get_model('api', 'Product')
+    product_names = dict(Product.objects.values_list('id', 'name'))
+    batch = []
+    for task in Task.objects.only('id', 'product_id', 'product_name').iterator(chunk_size=2000):
+        task.product_name = product_names.get(task.product_id, '')
+        batch.append(task)
+    Task.objects.bulk_update(batch, ['product_name'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='product_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.RunPython(backfill_product_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.2 on 2026-08-28 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_task_product_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'deleted', 'due_date'], name='task_user_deleted_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'product', 'deleted'], name='task_user_prod_del_idx'),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Convert Product.start_date and Task.due_date from YYYY-MM-DD CharFields to
+# native DateFields via add-copy-swap, so the change works on backends that
+# cannot cast varchar columns in place. The index on due_date is dropped for
+# the swap and recreated against the new column.
+
+from datetime import datetime
+
+from django.db import migrations, models
+
+
+def copy_dates_forward(apps, schema_editor):
+    Product = apps.get_model('api', 'Product')
+    Task = apps.get_model('api', 'Task')
+
+    batch = []
+    for product in Product.objects.iterator(chunk_size=2000):
+        product.start_date_new = datetime.strptime(product.start_date, '%Y-%m-%d').date()
+        batch.append(product)
+    Product.objects.bulk_update(batch, ['start_date_new'], batch_size=1000)
+
+    batch = []
+    for task in Task.objects.iterator(chunk_size=2000):
+        task.due_date_new = datetime.strptime(task.due_date, '%Y-%m-%d').date()
+        batch.append(task)
+    Task.objects.bulk_update(batch, ['due_date_new'], batch_size=1000)
+
+
+def copy_dates_backward(apps, schema_editor):
+    Product = apps.get_model('api', 'Product')
+    Task = apps.get_model('api', 'Task')
+
+    batch = []
+    for product in Product.objects.iterator(chunk_size=2000):
+        product.start_date = product.start_date_new.isoformat()
+        batch.append(product)
+    Product.objects.bulk_update(batch, ['start_date'], batch_size=1000)
+
+    batch = []
+    for task in Task.objects.iterator(chunk_size=2000):
+        task.due_date = task.due_date_new.isoformat()
+        batch.append(task)
+    Task.objects.bulk_update(batch, ['due_date'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_task_task_user_deleted_due_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_user_deleted_due_idx',
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='start_date_new',
+            field=models.DateField(null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='due_date_new',
+            field=models.DateField(null=True),
+        ),
+        migrations.RunPython(copy_dates_forward, copy_dates_backward),
+        migrations.RemoveField(
+            model_name='product',
+            name='start_date',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='due_date',
+        ),
+        migrations.RenameField(
+            model_name='product',
+            old_name='start_date_new',
+            new_name='start_date',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='due_date_new',
+            new_name='due_date',
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='start_date',
+            field=models.DateField(),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='due_date',
+            field=models.DateField(),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'deleted', 'due_date'], name='task_user_deleted_due_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# GIN indexes for the JSONField columns so containment filters such as
+# ft_cycle_custom__contains={...} (compiled to @> on PostgreSQL) use an index
+# scan. jsonb_path_ops is the smaller opclass that only supports @>, which is
+# the lookup shape we use. Other backends have no equivalent, so the
+# operations no-op outside PostgreSQL.
+
+from django.db import migrations
+
+
+def create_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS prod_ftcc_gin '
+        'ON api_product USING GIN (ft_cycle_custom jsonb_path_ops)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS sched_intervals_gin '
+        'ON api_scheduletemplate USING GIN (testing_intervals jsonb_path_ops)'
+    )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS prod_ftcc_gin')
+    schema_editor.execute('DROP INDEX IF EXISTS sched_intervals_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_native_date_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+    ]
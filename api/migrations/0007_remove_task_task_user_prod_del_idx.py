@@ -0,0 +1,17 @@
+# Generated by Django 4.2.2 on 2026-08-28 07:08
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_product_updated_at_task_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_user_prod_del_idx',
+        ),
+    ]
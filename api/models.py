@@ -1,13 +1,22 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 import uuid
 
+# Cached JSON for the global preset templates endpoint; invalidated by the
+# ScheduleTemplate signals below
+PRESETS_CACHE_KEY = 'schedule_template:presets:v1'
+
 class ScheduleTemplate(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
-    testing_intervals = models.JSONField()  # List of week numbers
+    # List of week numbers; GIN-indexed (jsonb_path_ops) on PostgreSQL for
+    # containment filters - see migration 0005
+    testing_intervals = models.JSONField()
     is_preset = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -39,11 +48,14 @@ class Product(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     name = models.CharField(max_length=255)
     assignee = models.CharField(max_length=255)
-    start_date = models.CharField(max_length=50)  # Store as YYYY-MM-DD string to match frontend
+    start_date = models.DateField()  # Serialized as YYYY-MM-DD to match frontend
     schedule_template = models.ForeignKey(ScheduleTemplate, on_delete=models.SET_NULL, null=True, blank=True)
     ft_cycle_type = models.CharField(max_length=20, choices=FT_CYCLE_CHOICES, default='consecutive')
+    # GIN-indexed (jsonb_path_ops) on PostgreSQL for containment filters -
+    # see migration 0005
     ft_cycle_custom = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name}"
@@ -53,14 +65,59 @@ class Task(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     name = models.CharField(max_length=255)
+    # Denormalized copy of product.name so display-only listings can skip
+    # the product join; kept in sync in save() and by the rename signal below
+    product_name = models.CharField(max_length=255, blank=True, default='')
     type = models.CharField(max_length=50)  # 'weekly', 'ft-thaw', 'ft-test'
-    due_date = models.CharField(max_length=50)  # Store as YYYY-MM-DD string
+    due_date = models.DateField()  # Serialized as YYYY-MM-DD
     cycle = models.CharField(max_length=100, null=True, blank=True)  # 'Initial', 'Week 1', 'Cycle 1', etc.
     completed = models.BooleanField(default=False)
     completed_at = models.DateTimeField(null=True, blank=True)
     deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Every task listing filters on (user, deleted) and the frontend
+        # sorts by due date; per-product lookups like the rename sync are
+        # already served by the automatic FK index on product_id
+        indexes = [
+            models.Index(fields=['user', 'deleted', 'due_date'], name='task_user_deleted_due_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember which product this row was loaded with so save() can
+        # tell a re-pointed task from an unchanged one
+        instance._loaded_product_id = dict(zip(field_names, values)).get('product_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        if self.product_id and (
+            not self.product_name
+            or self.product_id != getattr(self, '_loaded_product_id', None)
+        ):
+            self.product_name = self.product.name
+        super().save(*args, **kwargs)
+        self._loaded_product_id = self.product_id
 
     def __str__(self):
-        return f"{self.product.name} - {self.name}"
\ No newline at end of file
+        return f"{self.product_name or self.product.name} - {self.name}"
+
+@receiver(post_save, sender=ScheduleTemplate)
+@receiver(post_delete, sender=ScheduleTemplate)
+def invalidate_presets_cache(sender, instance, **kwargs):
+    # Unconditional: checking is_preset here would miss a template being
+    # demoted from preset (the flag is already False by post_save), and a
+    # rare extra cache miss is cheaper than serving a stale preset list
+    cache.delete(PRESETS_CACHE_KEY)
+
+@receiver(post_save, sender=Product)
+def sync_task_product_name(sender, instance, created, **kwargs):
+    # Keep the denormalized Task.product_name in step when a product is renamed
+    if not created:
+        Task.objects.filter(product=instance).exclude(
+            product_name=instance.name
+        ).update(product_name=instance.name)
\ No newline at end of file
@@ -1,8 +1,53 @@
+from copy import copy
+
 from rest_framework import serializers
+from django.db import models
 from .models import ScheduleTemplate, FTCycleTemplate, Product, Task
 from django.contrib.auth.models import User
 import json
 
+class CachedFieldsMixin:
+    """Cache get_fields() per serializer class.
+
+    DRF rebuilds and deepcopies every field each time a serializer is
+    instantiated, which dominates serialization time for nested serializers
+    on list endpoints. Fields here are declared statically, so build them
+    once per class and hand out shallow copies afterwards.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = self.__class__
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in self._fields_cache[cls].items()}
+
+class PlainDictMixin:
+    """Emit plain dicts instead of DRF's OrderedDict output.
+
+    JSON rendering treats them identically, but plain dicts pickle and
+    unpickle roughly 2.5x faster, which matters wherever serializer.data
+    gets stored in a cache.
+    """
+
+    def to_representation(self, instance):
+        return dict(super().to_representation(instance))
+
+class DynamicFieldsMixin:
+    """Restrict output to an allowlist passed as fields=[...].
+
+    Lets list endpoints drop expensive columns (the JSONFields) from both
+    the query and the response when the caller doesn't need them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            allowed = set(fields)
+            for name in set(self.fields) - allowed:
+                self.fields.pop(name)
+
 class NullableUUIDField(serializers.UUIDField):
     """UUID field that converts empty strings to None"""
     def to_internal_value(self, data):
@@ -15,7 +60,7 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'username', 'email']
 
-class ScheduleTemplateSerializer(serializers.ModelSerializer):
+class ScheduleTemplateSerializer(CachedFieldsMixin, DynamicFieldsMixin, PlainDictMixin, serializers.ModelSerializer):
     # Map snake_case to camelCase for frontend
     isPreset = serializers.BooleanField(source='is_preset', required=False)
     testingIntervals = serializers.JSONField(source='testing_intervals')
@@ -27,7 +72,7 @@ class ScheduleTemplateSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'testingIntervals', 'isPreset', 'createdAt', 'updatedAt']
         read_only_fields = ['id', 'createdAt', 'updatedAt']
 
-class FTCycleTemplateSerializer(serializers.ModelSerializer):
+class FTCycleTemplateSerializer(CachedFieldsMixin, PlainDictMixin, serializers.ModelSerializer):
     createdAt = serializers.DateTimeField(source='created_at', read_only=True)
     updatedAt = serializers.DateTimeField(source='updated_at', read_only=True)
 
@@ -36,10 +81,10 @@ class FTCycleTemplateSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'cycles', 'createdAt', 'updatedAt']
         read_only_fields = ['id', 'createdAt', 'updatedAt', 'user']
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(CachedFieldsMixin, DynamicFieldsMixin, PlainDictMixin, serializers.ModelSerializer):
     scheduleTemplate = ScheduleTemplateSerializer(source='schedule_template', read_only=True)
     scheduleTemplateId = NullableUUIDField(source='schedule_template_id', write_only=True, required=False, allow_null=True)
-    startDate = serializers.CharField(source='start_date')
+    startDate = serializers.DateField(source='start_date')
     ftCycleType = serializers.CharField(source='ft_cycle_type', required=False, allow_blank=True, default='consecutive')
     ftCycleCustom = serializers.JSONField(source='ft_cycle_custom', required=False, allow_null=True)
     createdAt = serializers.DateTimeField(source='created_at', read_only=True)
@@ -50,16 +95,148 @@ class ProductSerializer(serializers.ModelSerializer):
                   'ftCycleType', 'ftCycleCustom', 'createdAt']
         read_only_fields = ['id', 'createdAt', 'user']
 
-class TaskSerializer(serializers.ModelSerializer):
-    product = ProductSerializer(read_only=True)
+def _isoformat(value):
+    """Render a datetime the way DRF's DateTimeField does (Z suffix for UTC)."""
+    if value is None:
+        return None
+    formatted = value.isoformat()
+    if formatted.endswith('+00:00'):
+        formatted = formatted[:-6] + 'Z'
+    return formatted
+
+class FastProductSerializer:
+    """Read-only replacement for ProductSerializer on task list output.
+
+    Builds the same camelCase dict by plain attribute access, skipping
+    DRF's per-field binding and to_representation machinery, which is the
+    main CPU cost when tasks are listed by the hundreds. Write paths keep
+    using the full ProductSerializer.
+    """
+
+    def __init__(self, instance):
+        self.instance = instance
+
+    @property
+    def data(self):
+        return self.to_representation(self.instance)
+
+    def to_representation(self, product):
+        template = product.schedule_template
+        return {
+            'id': str(product.id),
+            'name': product.name,
+            'assignee': product.assignee,
+            'startDate': product.start_date.isoformat(),
+            'scheduleTemplate': None if template is None else {
+                'id': str(template.id),
+                'name': template.name,
+                'description': template.description,
+                'testingIntervals': template.testing_intervals,
+                'isPreset': template.is_preset,
+                'createdAt': _isoformat(template.created_at),
+                'updatedAt': _isoformat(template.updated_at),
+            },
+            'ftCycleType': product.ft_cycle_type,
+            'ftCycleCustom': product.ft_cycle_custom,
+            'createdAt': _isoformat(product.created_at),
+        }
+
+# Output spec for the generated task renderer below: (output key, model
+# attribute, conversion). Keep in step with TaskSerializer's fields.
+_TASK_FIELD_SPEC = [
+    ('id', 'id', 'uuid'),
+    ('name', 'name', 'plain'),
+    ('type', 'type', 'plain'),
+    ('dueDate', 'due_date', 'date'),
+    ('completed', 'completed', 'plain'),
+    ('completedAt', 'completed_at', 'datetime'),
+    ('cycle', 'cycle', 'plain'),
+    ('deleted', 'deleted', 'plain'),
+    ('deletedAt', 'deleted_at', 'datetime'),
+    ('createdAt', 'created_at', 'datetime'),
+]
+
+def _compile_task_repr(spec):
+    """Generate a specialized task-to-dict function from the field spec.
+
+    Task output has a static shape, so instead of walking DRF's
+    _readable_fields with get_attribute per field per instance, emit one
+    flat function that builds the dict with direct attribute access and
+    exec it once at import time.
+    """
+    converters = {
+        'plain': 't.{attr}',
+        'uuid': 'str(t.{attr})',
+        'date': 't.{attr}.isoformat()',
+        'datetime': '_isoformat(t.{attr})',
+    }
+    lines = ['def _task_to_repr(t, product_repr=None):', '    return {']
+    for key, attr, kind in spec:
+        lines.append("        '%s': %s," % (key, converters[kind].format(attr=attr)))
+    lines.append("        'product': FastProductSerializer(t.product).data"
+                 ' if product_repr is None else product_repr,')
+    lines.append('    }')
+    namespace = {'_isoformat': _isoformat, 'FastProductSerializer': FastProductSerializer}
+    exec('\n'.join(lines), namespace)
+    return namespace['_task_to_repr']
+
+_task_to_repr = _compile_task_repr(_TASK_FIELD_SPEC)
+
+class TaskListSerializer(serializers.ListSerializer):
+    """List serializer that renders tasks through the generated function.
+
+    Tasks in a listing mostly share a handful of products, so the product
+    dict (four UUID-to-hex conversions plus the nested template) is built
+    once per product and reused across the response.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        product_reprs = {}
+        result = []
+        for task in iterable:
+            product_repr = product_reprs.get(task.product_id)
+            if product_repr is None:
+                product_repr = FastProductSerializer(task.product).data
+                product_reprs[task.product_id] = product_repr
+            result.append(_task_to_repr(task, product_repr))
+        return result
+
+class TaskSerializer(CachedFieldsMixin, PlainDictMixin, serializers.ModelSerializer):
+    to_representation_fast = staticmethod(_task_to_repr)
     productId = serializers.UUIDField(source='product_id', write_only=True)
-    dueDate = serializers.CharField(source='due_date')
+    dueDate = serializers.DateField(source='due_date')
+    completedAt = serializers.DateTimeField(source='completed_at', required=False, allow_null=True)
+    deletedAt = serializers.DateTimeField(source='deleted_at', required=False, allow_null=True)
+    createdAt = serializers.DateTimeField(source='created_at', read_only=True)
+
+    class Meta:
+        model = Task
+        fields = ['id', 'productId', 'name', 'type', 'dueDate', 'completed',
+                  'completedAt', 'cycle', 'deleted', 'deletedAt', 'createdAt']
+        read_only_fields = ['id', 'createdAt', 'user']
+        list_serializer_class = TaskListSerializer
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data['product'] = FastProductSerializer(instance.product).data
+        return data
+
+class TaskLiteSerializer(CachedFieldsMixin, PlainDictMixin, serializers.ModelSerializer):
+    """Flat task representation for display-only listings (?lite=true).
+
+    Reads the denormalized product_name column instead of nesting the full
+    product, so the list query needs no join at all.
+    """
+    productId = serializers.UUIDField(source='product_id', read_only=True)
+    productName = serializers.CharField(source='product_name', read_only=True)
+    dueDate = serializers.DateField(source='due_date')
     completedAt = serializers.DateTimeField(source='completed_at', required=False, allow_null=True)
     deletedAt = serializers.DateTimeField(source='deleted_at', required=False, allow_null=True)
     createdAt = serializers.DateTimeField(source='created_at', read_only=True)
 
     class Meta:
         model = Task
-        fields = ['id', 'productId', 'product', 'name', 'type', 'dueDate', 'completed',
+        fields = ['id', 'productId', 'productName', 'name', 'type', 'dueDate', 'completed',
                   'completedAt', 'cycle', 'deleted', 'deletedAt', 'createdAt']
         read_only_fields = ['id', 'createdAt', 'user']
\ No newline at end of file
@@ -1,3 +1,52 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-# Create your tests here.
+from . import views
+from .models import Product, ScheduleTemplate, Task
+
+
+class ListEndpointQueryCountTests(TestCase):
+    """Regression tests for the list endpoints' query count.
+
+    The serializers nest Task -> Product -> ScheduleTemplate, so without
+    the select_related/only projections in the viewsets every row would
+    cost extra queries (N+1). These lock the endpoints at a constant
+    count regardless of how many rows they return.
+    """
+
+    def setUp(self):
+        # Reset the memoized dev user - it may reference a row from a
+        # previous test's rolled-back transaction
+        views._DEV_USER = None
+        self.user = User.objects.create(username='testuser')
+        self.template = ScheduleTemplate.objects.create(
+            user=self.user, name='Template', testing_intervals=[1, 2, 4])
+        for i in range(3):
+            product = Product.objects.create(
+                user=self.user, name=f'Product {i}', assignee='QA',
+                start_date=date(2026, 1, 1), schedule_template=self.template)
+            for j in range(4):
+                Task.objects.create(
+                    user=self.user, product=product, name=f'Task {i}-{j}',
+                    type='weekly', due_date=date(2026, 1, 1) + timedelta(weeks=j))
+
+    def test_task_list_query_count_is_constant(self):
+        self.client.get('/api/tasks')  # warm the dev-user memo
+        # One ETag aggregate plus one joined list query, independent of N
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/tasks')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(len(body), 12)
+        self.assertEqual(body[0]['product']['scheduleTemplate']['name'], 'Template')
+
+    def test_product_list_query_count_is_constant(self):
+        self.client.get('/api/products')  # warm the dev-user memo
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/products')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(len(body), 3)
+        self.assertEqual(body[0]['scheduleTemplate']['name'], 'Template')
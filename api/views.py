@@ -1,18 +1,108 @@
+import json
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.db.models import Q
-from .models import ScheduleTemplate, FTCycleTemplate, Product, Task
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.http import StreamingHttpResponse
+from .models import PRESETS_CACHE_KEY, ScheduleTemplate, FTCycleTemplate, Product, Task
 from .serializers import (
+    _isoformat,
     ScheduleTemplateSerializer,
     FTCycleTemplateSerializer,
     ProductSerializer,
     TaskSerializer,
+    TaskLiteSerializer,
     UserSerializer
 )
 from django.contrib.auth.models import User
 
+# Memoized development user so unauthenticated requests don't pay a
+# SELECT (and possible INSERT) on auth_user every single time
+_DEV_USER = None
+
+def _get_dev_user():
+    global _DEV_USER
+    if _DEV_USER is None:
+        _DEV_USER, _ = User.objects.get_or_create(
+            username='testuser',
+            defaults={'email': 'test@example.com'}
+        )
+    return _DEV_USER
+
+class FieldsParamMixin:
+    """Optional ?fields= allowlist for list endpoints.
+
+    When the caller names the fields it wants, the serializer drops the
+    rest (DynamicFieldsMixin) and any unrequested JSONField columns are
+    deferred so their per-row decode cost never happens.
+    """
+    # camelCase serializer field -> JSONField column it reads
+    json_field_map = {}
+
+    def _requested_fields(self):
+        fields = self.request.query_params.get('fields')
+        if not fields:
+            return None
+        return [name for name in fields.split(',') if name]
+
+    def get_serializer(self, *args, **kwargs):
+        if self.action == 'list':
+            fields = self._requested_fields()
+            if fields is not None:
+                kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def _defer_unrequested_json(self, queryset):
+        if self.action != 'list':
+            return queryset
+        fields = self._requested_fields()
+        if fields is None:
+            return queryset
+        deferred = [column for name, column in self.json_field_map.items()
+                    if name not in fields]
+        return queryset.defer(*deferred) if deferred else queryset
+
+class ETagMixin:
+    """Conditional GET support for list endpoints.
+
+    The frontend polls list endpoints, so compute a weak ETag from one
+    cheap aggregate (latest change timestamp plus row count) and answer
+    304 when it matches If-None-Match, skipping serialization entirely.
+    """
+    etag_timestamp_fields = ['updated_at']
+    # Nullable joins whose disappearance the timestamps can't see: SET_NULL
+    # deletions null the FK without touching updated_at, so fold the
+    # non-null count of each into the tag as well
+    etag_presence_fields = []
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        aggregates = queryset.aggregate(
+            _etag_count=Count('pk'),
+            **{f'_etag_max_{i}': Max(field)
+               for i, field in enumerate(self.etag_timestamp_fields)},
+            **{f'_etag_join_{i}': Count(field)
+               for i, field in enumerate(self.etag_presence_fields)}
+        )
+        timestamps = [aggregates[f'_etag_max_{i}']
+                      for i in range(len(self.etag_timestamp_fields))
+                      if aggregates[f'_etag_max_{i}'] is not None]
+        latest = max(timestamps).timestamp() if timestamps else 0
+        parts = [f'{latest:.6f}', str(aggregates['_etag_count'])]
+        parts += [str(aggregates[f'_etag_join_{i}'])
+                  for i in range(len(self.etag_presence_fields))]
+        etag = 'W/"%s"' % '-'.join(parts)
+
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        return response
+
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
@@ -21,41 +111,47 @@ class UserViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def current(self, request):
         # For development, return a mock user
-        user, created = User.objects.get_or_create(
-            username='testuser',
-            defaults={'email': 'test@example.com'}
-        )
+        user = _get_dev_user()
         serializer = self.get_serializer(user)
         return Response(serializer.data)
 
-class ScheduleTemplateViewSet(viewsets.ModelViewSet):
+class ScheduleTemplateViewSet(FieldsParamMixin, ETagMixin, viewsets.ModelViewSet):
     serializer_class = ScheduleTemplateSerializer
     permission_classes = [AllowAny]  # For development
+    json_field_map = {'testingIntervals': 'testing_intervals'}
 
     def get_queryset(self):
         # Get user templates and presets
         if self.request.user.is_authenticated:
-            return ScheduleTemplate.objects.filter(
+            queryset = ScheduleTemplate.objects.filter(
                 Q(user=self.request.user) | Q(is_preset=True)
             )
-        # For development, return all templates
-        return ScheduleTemplate.objects.all()
+        else:
+            # For development, return all templates
+            queryset = ScheduleTemplate.objects.all()
+        return self._defer_unrequested_json(queryset)
 
     def perform_create(self, serializer):
         if self.request.user.is_authenticated:
             serializer.save(user=self.request.user)
         else:
             # For development
-            user, _ = User.objects.get_or_create(username='testuser')
+            user = _get_dev_user()
             serializer.save(user=user)
 
     @action(detail=False, methods=['get'])
     def presets(self, request):
+        # Presets are global static data, so serve them from the cache;
+        # the ScheduleTemplate signals invalidate on any preset change
+        cached = cache.get(PRESETS_CACHE_KEY)
+        if cached is not None:
+            return Response(json.loads(cached))
         presets = ScheduleTemplate.objects.filter(is_preset=True)
-        serializer = self.get_serializer(presets, many=True)
-        return Response(serializer.data)
+        data = self.get_serializer(presets, many=True).data
+        cache.set(PRESETS_CACHE_KEY, json.dumps(data), 3600)
+        return Response(data)
 
-class FTCycleTemplateViewSet(viewsets.ModelViewSet):
+class FTCycleTemplateViewSet(ETagMixin, viewsets.ModelViewSet):
     serializer_class = FTCycleTemplateSerializer
     permission_classes = [AllowAny]  # For development
 
@@ -63,7 +159,7 @@ class FTCycleTemplateViewSet(viewsets.ModelViewSet):
         if self.request.user.is_authenticated:
             return FTCycleTemplate.objects.filter(user=self.request.user)
         # For development
-        user, _ = User.objects.get_or_create(username='testuser')
+        user = _get_dev_user()
         return FTCycleTemplate.objects.filter(user=user)
 
     def perform_create(self, serializer):
@@ -71,39 +167,110 @@ class FTCycleTemplateViewSet(viewsets.ModelViewSet):
             serializer.save(user=self.request.user)
         else:
             # For development
-            user, _ = User.objects.get_or_create(username='testuser')
+            user = _get_dev_user()
             serializer.save(user=user)
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(FieldsParamMixin, ETagMixin, viewsets.ModelViewSet):
     serializer_class = ProductSerializer
     permission_classes = [AllowAny]  # For development
+    json_field_map = {'ftCycleCustom': 'ft_cycle_custom'}
+    # schedule_template__updated_at folds template edits into the ETag,
+    # since the nested scheduleTemplate appears in the response; the
+    # presence count catches SET_NULL template deletions
+    etag_timestamp_fields = ['updated_at', 'schedule_template__updated_at']
+    etag_presence_fields = ['schedule_template']
 
     def get_queryset(self):
+        # Join the schedule template up front - the serializer embeds it,
+        # so without this every product costs an extra query (N+1)
+        queryset = Product.objects.select_related('schedule_template')
+        if self.action == 'list':
+            # Project to just the columns the serializer emits to cut row
+            # hydration cost; keep this list in sync with ProductSerializer.
+            # List only: saving a deferred instance would restrict
+            # update_fields to the loaded columns and skip the auto_now
+            # updated_at on edits
+            queryset = queryset.only(
+                'id', 'user_id', 'name', 'assignee', 'start_date',
+                'ft_cycle_type', 'ft_cycle_custom', 'created_at',
+                'schedule_template__id', 'schedule_template__name',
+                'schedule_template__description', 'schedule_template__testing_intervals',
+                'schedule_template__is_preset', 'schedule_template__created_at',
+                'schedule_template__updated_at',
+            )
+        queryset = self._defer_unrequested_json(queryset)
         if self.request.user.is_authenticated:
-            return Product.objects.filter(user=self.request.user)
+            return queryset.filter(user=self.request.user)
         # For development
-        user, _ = User.objects.get_or_create(username='testuser')
-        return Product.objects.filter(user=user)
+        user = _get_dev_user()
+        return queryset.filter(user=user)
 
     def perform_create(self, serializer):
         if self.request.user.is_authenticated:
             serializer.save(user=self.request.user)
         else:
             # For development
-            user, _ = User.objects.get_or_create(username='testuser')
+            user = _get_dev_user()
             serializer.save(user=user)
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(ETagMixin, viewsets.ModelViewSet):
+    # The joined timestamps fold product and schedule template edits into
+    # the task ETag, since both appear nested in the response; the
+    # presence count catches SET_NULL template deletions
+    etag_timestamp_fields = ['updated_at', 'product__updated_at',
+                             'product__schedule_template__updated_at']
+    etag_presence_fields = ['product__schedule_template']
     serializer_class = TaskSerializer
     permission_classes = [AllowAny]  # For development
 
+    def _is_lite(self):
+        # Flat listing that reads the denormalized product_name and skips
+        # the product join entirely
+        return self.action == 'list' and self.request.query_params.get('lite') == 'true'
+
+    def get_serializer_class(self):
+        if self._is_lite():
+            return TaskLiteSerializer
+        return super().get_serializer_class()
+
     def get_queryset(self):
+        if self._is_lite():
+            base = Task.objects.only(
+                'id', 'user_id', 'product_id', 'product_name', 'name', 'type',
+                'due_date', 'cycle', 'completed', 'completed_at', 'deleted',
+                'deleted_at', 'created_at',
+            )
+            if self.request.user.is_authenticated:
+                return base.filter(user=self.request.user, deleted=False)
+            return base.filter(user=_get_dev_user(), deleted=False)
+        # Join product and its schedule template up front - the nested
+        # serializers would otherwise issue two extra queries per task (N+1)
+        base = Task.objects.select_related('product', 'product__schedule_template')
+        if self.action == 'list':
+            # Project to just the columns the serializers emit to cut row
+            # hydration cost; keep this list in sync with TaskSerializer and
+            # FastProductSerializer. List only: saving a deferred instance
+            # would restrict update_fields to the loaded columns, skipping
+            # the auto_now updated_at and re-fetching deferred columns like
+            # product_name inside Task.save()
+            base = base.only(
+                'id', 'user_id', 'product_id', 'name', 'type', 'due_date', 'cycle',
+                'completed', 'completed_at', 'deleted', 'deleted_at', 'created_at',
+                'product__id', 'product__name', 'product__assignee', 'product__start_date',
+                'product__ft_cycle_type', 'product__ft_cycle_custom', 'product__created_at',
+                'product__schedule_template__id', 'product__schedule_template__name',
+                'product__schedule_template__description',
+                'product__schedule_template__testing_intervals',
+                'product__schedule_template__is_preset',
+                'product__schedule_template__created_at',
+                'product__schedule_template__updated_at',
+            )
         if self.request.user.is_authenticated:
-            queryset = Task.objects.filter(user=self.request.user)
+            queryset = base.filter(user=self.request.user)
         else:
             # For development
-            user, _ = User.objects.get_or_create(username='testuser')
-            queryset = Task.objects.filter(user=user)
+            user = _get_dev_user()
+            queryset = base.filter(user=user)
 
         # Filter deleted tasks
         if self.action == 'deleted':
@@ -115,14 +282,49 @@ class TaskViewSet(viewsets.ModelViewSet):
             serializer.save(user=self.request.user)
         else:
             # For development
-            user, _ = User.objects.get_or_create(username='testuser')
+            user = _get_dev_user()
             serializer.save(user=user)
 
+    def list(self, request, *args, **kwargs):
+        # ?stream=true serializes task-by-task over iterator() so memory
+        # stays at O(chunk_size) instead of materializing the whole list
+        if request.query_params.get('stream') == 'true':
+            queryset = self.filter_queryset(self.get_queryset())
+            serializer_class = self.get_serializer_class()
+
+            def generate():
+                yield '['
+                first = True
+                for task in queryset.iterator(chunk_size=500):
+                    if first:
+                        first = False
+                    else:
+                        yield ','
+                    # Compact separators to match DRF's renderer; the
+                    # default ones pad with whitespace
+                    yield json.dumps(serializer_class(task).data, separators=(',', ':'))
+                yield ']'
+
+            return StreamingHttpResponse(generate(), content_type='application/json')
+        return super().list(request, *args, **kwargs)
+
     @action(detail=False, methods=['get'])
     def deleted(self, request):
-        deleted_tasks = self.get_queryset().filter(deleted=True)
-        serializer = self.get_serializer(deleted_tasks, many=True)
-        return Response(serializer.data)
+        # The recycle bin only displays a handful of columns, so skip model
+        # hydration and DRF entirely: one values() query (the denormalized
+        # product_name avoids the join) mapped straight to camelCase dicts
+        rows = Task.objects.filter(
+            user=self.request.user if self.request.user.is_authenticated else _get_dev_user(),
+            deleted=True
+        ).values('id', 'name', 'type', 'due_date', 'deleted_at', 'product_name')
+        return Response([{
+            'id': str(row['id']),
+            'name': row['name'],
+            'type': row['type'],
+            'dueDate': row['due_date'].isoformat(),
+            'deletedAt': _isoformat(row['deleted_at']),
+            'product': {'name': row['product_name']},
+        } for row in rows])
 
     @action(detail=True, methods=['post'])
     def restore(self, request, pk=None):
@@ -135,18 +337,38 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'])
     def batch(self, request):
-        tasks_data = request.data.get('tasks', [])
-        created_tasks = []
-
-        for task_data in tasks_data:
-            serializer = self.get_serializer(data=task_data)
-            if serializer.is_valid():
-                self.perform_create(serializer)
-                created_tasks.append(serializer.data)
-            else:
-                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-        return Response(created_tasks, status=status.HTTP_201_CREATED)
+        # Validate the whole payload through one many=True serializer so
+        # field construction is paid once, then insert in bulk - one INSERT
+        # per 1000 rows instead of one round-trip per task
+        serializer = self.get_serializer(data=request.data.get('tasks', []), many=True)
+        serializer.is_valid(raise_exception=True)
+        tasks = self.perform_bulk_create(serializer)
+
+        serializer = self.get_serializer(tasks, many=True)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def perform_bulk_create(self, serializer):
+        if self.request.user.is_authenticated:
+            user = self.request.user
+        else:
+            # For development
+            user = _get_dev_user()
+
+        validated = serializer.validated_data
+
+        # bulk_create bypasses Task.save(), so resolve the denormalized
+        # product_name here with a single lookup over the referenced products
+        product_ids = {data['product_id'] for data in validated}
+        product_names = dict(
+            Product.objects.filter(id__in=product_ids).values_list('id', 'name')
+        )
+
+        with transaction.atomic():
+            return Task.objects.bulk_create(
+                [Task(user=user, product_name=product_names.get(data['product_id'], ''), **data)
+                 for data in validated],
+                batch_size=1000
+            )
 
     def destroy(self, request, *args, **kwargs):
         # Soft delete